@@ -4,13 +4,19 @@ import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 from gi.repository import Gtk, Adw, Gio, GLib, Gdk, Pango
+import atexit
+import functools
 import gettext
 import locale
 import os
 import sys
 import json
+import queue
 import random
+import shutil
+import sqlite3
 import subprocess
+import threading
 import time
 from pathlib import Path
 from bokstavsresan import __version__
@@ -44,6 +50,16 @@ LETTER_SOUNDS = {
     "Z": "sss", "Å": "ååå", "Ä": "äää", "Ö": "ööö",
 }
 
+# Alphabet order with parallel tuples for indexed lookup
+LETTERS = tuple(LETTER_PHONETICS)
+LETTER_INDEX = {letter: i for i, letter in enumerate(LETTERS)}
+PHONETICS = tuple(LETTER_PHONETICS[letter] for letter in LETTERS)
+SOUNDS_T = tuple(LETTER_SOUNDS[letter] for letter in LETTERS)
+
+# Pre-encoded TTS input for the fixed letter utterances
+PHONETIC_BYTES = tuple(name.encode("utf-8") for name in PHONETICS)
+SOUND_BYTES = tuple(sound.encode("utf-8") for sound in SOUNDS_T)
+
 # Simple Swedish words grouped by difficulty
 WORDS_EASY = [
     ("SOL", _("sun")), ("KAT", _("cat")), ("HUS", _("house")),
@@ -65,6 +81,10 @@ WORDS_HARD = [
     ("SJUNGA", _("sing")), ("HIMMEL", _("sky")), ("VATTEN", _("water")),
 ]
 
+MAX_WORD_LEN = max(
+    len(word) for word, _hint in WORDS_EASY + WORDS_MEDIUM + WORDS_HARD
+)
+
 ENCOURAGEMENTS = [
     _("Great job! ⭐"), _("Fantastic! 🌟"), _("You're a star! ✨"),
     _("Amazing! 🎉"), _("Well done! 👏"), _("Keep going! 💪"),
@@ -77,9 +97,18 @@ TRY_AGAIN = [
     _("You can do it! 🎯"), _("Don't give up! Keep trying! 💫"),
 ]
 
+STYLE_PATH = os.path.join(os.path.dirname(__file__), "style.css")
 CONFIG_DIR = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")) / "bokstavsresan"
 
 
+def _letter_sound(letter):
+    """Return a letter's sound as text and as pre-encoded TTS input."""
+    i = LETTER_INDEX.get(letter)
+    if i is None:
+        return letter, letter.encode("utf-8")
+    return SOUNDS_T[i], SOUND_BYTES[i]
+
+
 def _get_current_lang():
     """Get current UI language code for TTS."""
     import locale as _locale
@@ -98,99 +127,259 @@ _PIPER_VOICES = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def _get_tts_engine():
     """Get TTS engine: Piper first, espeak-ng fallback."""
-    try:
-        subprocess.run(["piper", "--help"], capture_output=True, timeout=2)
+    model_path = os.path.expanduser(
+        _PIPER_VOICES.get(_get_current_lang(), _PIPER_VOICES["sv"])
+    )
+    if shutil.which("piper") and os.path.isfile(model_path):
         return "piper"
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
-    try:
-        subprocess.run(["espeak-ng", "--help"], capture_output=True, timeout=2)
+    if shutil.which("espeak-ng"):
         return "espeak-ng"
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
     return None
 
 
-def _speak(text, engine=None):
-    """Speak text using TTS."""
-    if engine is None:
-        engine = _get_tts_engine()
-    if engine is None:
-        return
-    lang = _get_current_lang()
-    try:
-        if engine == "piper":
-            model_path = os.path.expanduser(
-                _PIPER_VOICES.get(lang, _PIPER_VOICES["sv"])
-            )
-            proc = subprocess.Popen(
+class TTSService:
+    """Long-lived TTS: one Piper process piped into one aplay process,
+    or one espeak-ng process speaking each line it reads from stdin.
+
+    Utterances are queued and written to the engine from a worker thread,
+    so speaking never blocks the GTK main loop. The engine is detected and
+    launched by that thread after start(), while the window is drawn.
+    """
+
+    def __init__(self):
+        self.engine = None
+        self.lang = None
+        self.piper = None
+        self.aplay = None
+        self.espeak = None
+        self._q = queue.Queue(maxsize=32)
+        self._thread = None
+
+    def start(self):
+        """Detect and warm up the TTS engine in the background."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, daemon=True)
+            self._thread.start()
+
+    def _start_piper(self):
+        model_path = os.path.expanduser(
+            _PIPER_VOICES.get(self.lang, _PIPER_VOICES["sv"])
+        )
+        try:
+            self.piper = subprocess.Popen(
                 ["piper", "--model", model_path,
                  "--output-raw", "--length-scale", "1.5"],
-                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL, bufsize=0,
             )
-            audio, _ = proc.communicate(text.encode(), timeout=10)
-            if audio:
-                subprocess.Popen(
-                    ["aplay", "-r", "22050", "-f", "S16_LE", "-c", "1", "-q"],
-                    stdin=subprocess.PIPE,
-                ).communicate(audio, timeout=10)
-        elif engine == "espeak-ng":
-            subprocess.run(
-                ["espeak-ng", "-v", lang, text],
-                capture_output=True, timeout=10,
+            self.aplay = subprocess.Popen(
+                ["aplay", "-r", "22050", "-f", "S16_LE", "-c", "1", "-q",
+                 "-B", "500000"],
+                stdin=subprocess.PIPE, bufsize=0,
             )
-    except Exception:
-        pass
+        except OSError:
+            self.terminate()
+            self.engine = None
+            return
+        threading.Thread(
+            target=self._pump, args=(self.piper, self.aplay), daemon=True
+        ).start()
+
+    def _start_espeak(self):
+        try:
+            self.espeak = subprocess.Popen(
+                ["espeak-ng", "-v", self.lang],
+                stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL, bufsize=0,
+            )
+        except OSError:
+            self.engine = None
+
+    @staticmethod
+    def _pump(piper, aplay):
+        """Forward raw audio from Piper to aplay until Piper exits.
+
+        If aplay dies, keep draining Piper's output and discard it, so Piper
+        never blocks on a full pipe and stops reading new text.
+        """
+        while True:
+            chunk = piper.stdout.read(4096)
+            if not chunk:
+                break
+            if aplay is None:
+                continue
+            try:
+                aplay.stdin.write(chunk)
+            except (BrokenPipeError, OSError):
+                aplay = None
+
+    def _worker(self):
+        """Launch the engine, then feed it queued utterances one at a time."""
+        self.lang = _get_current_lang()
+        self.engine = _get_tts_engine()
+        if self.engine == "piper":
+            self._start_piper()
+        elif self.engine == "espeak-ng":
+            self._start_espeak()
+        while True:
+            self._say(self._q.get())
+
+    def _say(self, data):
+        """Speak UTF-8 encoded text using TTS."""
+        proc = self.piper if self.engine == "piper" else self.espeak
+        if proc is None:
+            return
+        try:
+            proc.stdin.write(data + b"\n")
+            proc.stdin.flush()
+        except Exception:
+            pass
+
+    def speak(self, text):
+        """Queue text to be spoken."""
+        self.speak_bytes(text.encode("utf-8"))
+
+    def speak_bytes(self, data):
+        """Queue UTF-8 text to be spoken; drops the oldest utterance if full."""
+        try:
+            self._q.put_nowait(data)
+        except queue.Full:
+            try:
+                self._q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._q.put_nowait(data)
+            except queue.Full:
+                pass
+
+    def interrupt(self):
+        """Drop all utterances that have not been spoken yet."""
+        while True:
+            try:
+                self._q.get_nowait()
+            except queue.Empty:
+                break
+
+    def terminate(self, *_args):
+        """Stop the TTS processes."""
+        for proc in (self.piper, self.aplay, self.espeak):
+            if proc is not None and proc.poll() is None:
+                proc.terminate()
+        self.piper = None
+        self.aplay = None
+        self.espeak = None
+        return False
 
 
 class ProgressStore:
-    """Track learning progress."""
+    """Track learning progress in a small SQLite database.
+
+    Counters live in a key/value table and mastered letters in their own
+    table. Updates are coalesced and committed at most every 500 ms.
+    """
+
+    COUNTERS = ("streak", "total_correct", "total_attempts", "stars", "level")
 
     def __init__(self):
-        self.path = CONFIG_DIR / "progress.json"
+        self.path = CONFIG_DIR / "progress.db"
         self.data = {"letters_mastered": [], "streak": 0, "total_correct": 0,
                      "total_attempts": 0, "stars": 0, "level": 1}
+        self._new_mastered = []
+        self._dirty = False
+        self._save_source = 0
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value INTEGER)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS mastered (letter TEXT PRIMARY KEY)"
+            )
         self._load()
+        atexit.register(self._flush)
 
     def _load(self):
+        rows = self._db.execute("SELECT key, value FROM kv").fetchall()
+        if rows:
+            self.data.update(rows)
+            self.data["letters_mastered"] = [
+                letter for (letter,) in
+                self._db.execute("SELECT letter FROM mastered ORDER BY rowid")
+            ]
+        else:
+            self._import_json()
+        self._mastered_set = set(self.data["letters_mastered"])
+
+    def _import_json(self):
+        """Carry over progress saved by older versions in progress.json."""
         try:
-            if self.path.exists():
-                with open(self.path) as f:
-                    self.data.update(json.load(f))
-        except Exception:
-            pass
+            raw = (CONFIG_DIR / "progress.json").read_bytes()
+            if not raw:
+                return
+            loaded = json.loads(raw)
+        except (OSError, ValueError):
+            return
+        if not isinstance(loaded, dict):
+            return
+        self.data.update(loaded)
+        self._new_mastered.extend(self.data["letters_mastered"])
+        self.save()
 
     def save(self):
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        with open(self.path, "w") as f:
-            json.dump(self.data, f, indent=2)
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO kv VALUES (?, ?)",
+                [(key, self.data[key]) for key in self.COUNTERS],
+            )
+            self._db.executemany(
+                "INSERT OR IGNORE INTO mastered VALUES (?)",
+                [(letter,) for letter in self._new_mastered],
+            )
+        self._new_mastered.clear()
+        self._dirty = False
+
+    def _schedule_save(self):
+        self._dirty = True
+        if self._save_source == 0:
+            self._save_source = GLib.timeout_add(500, self._flush)
+
+    def _flush(self):
+        self._save_source = 0
+        if self._dirty:
+            self.save()
+        return False
 
     def record_correct(self, letter):
         self.data["total_correct"] += 1
         self.data["total_attempts"] += 1
         self.data["streak"] += 1
         self.data["stars"] += 1
-        if letter not in self.data["letters_mastered"]:
+        if letter not in self._mastered_set:
+            self._mastered_set.add(letter)
             self.data["letters_mastered"].append(letter)
+            self._new_mastered.append(letter)
         if self.data["streak"] % 5 == 0:
             self.data["stars"] += 2  # bonus stars
-        self.save()
+        self._schedule_save()
 
     def record_wrong(self):
         self.data["total_attempts"] += 1
         self.data["streak"] = 0
-        self.save()
+        self._schedule_save()
 
 
 class LetterButton(Gtk.Button):
     """A big colorful letter button."""
 
-    COLORS = [
-        "#e74c3c", "#3498db", "#2ecc71", "#f39c12", "#9b59b6",
-        "#1abc9c", "#e67e22", "#e91e63", "#00bcd4", "#8bc34a",
-    ]
+    # Number of .letter-btn-cN color classes defined in style.css
+    N_COLORS = 10
 
     def __init__(self, letter, idx):
         super().__init__()
@@ -199,71 +388,50 @@ class LetterButton(Gtk.Button):
         label.add_css_class("letter-btn-label")
         self.set_child(label)
         self.add_css_class("letter-btn")
-        color = self.COLORS[idx % len(self.COLORS)]
-        css = f"""
-            .letter-btn {{ 
-                background: {color}; color: white; border-radius: 16px;
-                min-width: 64px; min-height: 64px; font-size: 28px; 
-                font-weight: bold; border: 3px solid rgba(255,255,255,0.3);
-                transition: all 200ms ease;
-            }}
-            .letter-btn:hover {{ 
-                transform: scale(1.1); 
-                box-shadow: 0 4px 12px rgba(0,0,0,0.3); 
-            }}
-            .letter-btn.correct {{
-                background: #27ae60; animation: pulse 500ms;
-            }}
-            .letter-btn.wrong {{
-                background: #c0392b; 
-            }}
-        """
-        provider = Gtk.CssProvider()
-        provider.load_from_string(css)
-        self.get_style_context().add_provider(provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+        self.add_css_class(f"letter-btn-c{idx % self.N_COLORS}")
+
+    def set_letter(self, letter):
+        """Show a new letter and clear any answer feedback."""
+        self.letter = letter
+        self.get_child().set_label(letter)
+        self.remove_css_class("correct")
+        self.remove_css_class("wrong")
 
 
 class App(Adw.Application):
     def __init__(self):
         super().__init__(application_id=APP_ID)
         self.connect("activate", self._on_activate)
-        self.tts_engine = _get_tts_engine()
+        self.tts = TTSService()
+        atexit.register(self.tts.terminate)
+        self.connect("shutdown", self.tts.terminate)
         self.progress = ProgressStore()
         self.current_mode = "explore"  # explore, find, soundout
         self.target_letter = None
         self.current_word = None
         self.current_word_idx = 0
+        self._last_stars = -1
+        self._last_streak = -1
+        self._wrong_source = 0
+        self._pages_built = set()
+        self.win = None
         
         # Easter egg state
         self._egg_clicks = 0
-        self._egg_timer = None
+        self._egg_last = 0.0
 
     def _on_activate(self, app):
+        if self.win is not None:
+            self.win.present()
+            return
         self.win = Adw.ApplicationWindow(application=app)
         self.win.set_title(_("Letter Journey"))
         self.win.set_default_size(900, 700)
+        self.tts.start()
 
         # CSS
         css = Gtk.CssProvider()
-        css.load_from_string("""
-            .title-big { font-size: 32px; font-weight: bold; }
-            .subtitle { font-size: 16px; color: alpha(@theme_fg_color, 0.7); }
-            .star-label { font-size: 24px; color: #f39c12; }
-            .streak-label { font-size: 18px; font-weight: bold; color: #e74c3c; }
-            .encourage-label { font-size: 22px; font-weight: bold; color: #27ae60; }
-            .word-display { font-size: 48px; font-weight: bold; letter-spacing: 8px; }
-            .word-letter { font-size: 48px; font-weight: bold; }
-            .word-letter-active { color: #e74c3c; font-size: 56px; }
-            .word-letter-done { color: #27ae60; }
-            .word-hint { font-size: 16px; color: alpha(@theme_fg_color, 0.5); }
-            .mode-btn { min-height: 80px; border-radius: 16px; }
-            .game-header { padding: 12px; }
-            .level-badge { 
-                background: #3498db; color: white; border-radius: 20px; 
-                padding: 4px 16px; font-weight: bold; 
-            }
-            .letter-btn-label { font-size: 28px; font-weight: bold; }
-        """)
+        css.load_from_path(STYLE_PATH)
         Gtk.StyleContext.add_provider_for_display(
             Gdk.Display.get_default(), css, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
@@ -311,11 +479,8 @@ class App(Adw.Application):
         # Main stack
         self.stack = Gtk.Stack(transition_type=Gtk.StackTransitionType.SLIDE_LEFT_RIGHT)
 
-        # Create pages
+        # Create pages; game pages are built on first visit
         self._build_menu_page()
-        self._build_explore_page()
-        self._build_find_page()
-        self._build_soundout_page()
 
         # Layout
         vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
@@ -334,12 +499,13 @@ class App(Adw.Application):
         self.win.present()
 
     def _check_welcome(self):
-        welcome_path = CONFIG_DIR / "welcome.json"
+        welcome_path = CONFIG_DIR / ".welcomed"
         if welcome_path.exists():
             return
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        with open(welcome_path, "w") as f:
-            json.dump({"shown": True}, f)
+        welcome_path.touch()
+        if (CONFIG_DIR / "welcome.json").exists():
+            return  # shown by an older version
 
         dialog = Adw.AlertDialog(
             heading=_("Welcome to Letter Journey! 🎉"),
@@ -446,8 +612,7 @@ class App(Adw.Application):
             row_spacing=8, column_spacing=8,
             homogeneous=True, halign=Gtk.Align.CENTER,
         )
-        letters = list(LETTER_PHONETICS.keys())
-        for i, letter in enumerate(letters):
+        for i, letter in enumerate(LETTERS):
             btn = LetterButton(letter, i)
             btn.connect("clicked", self._on_explore_letter)
             grid.append(btn)
@@ -492,6 +657,10 @@ class App(Adw.Application):
             row_spacing=12, column_spacing=12,
             homogeneous=True, halign=Gtk.Align.CENTER,
         )
+        self._find_buttons = [LetterButton("A", i) for i in range(6)]
+        for btn in self._find_buttons:
+            btn.connect("clicked", self._on_find_letter)
+            self.find_grid.append(btn)
         vbox.append(self.find_grid)
 
         # Next button
@@ -525,6 +694,13 @@ class App(Adw.Application):
 
         # Word display with individual letters
         self.word_box = Gtk.Box(spacing=8, halign=Gtk.Align.CENTER)
+        self._word_labels = []
+        for _i in range(MAX_WORD_LEN):
+            lbl = Gtk.Label()
+            lbl.add_css_class("word-letter")
+            lbl.set_visible(False)
+            self.word_box.append(lbl)
+            self._word_labels.append(lbl)
         vbox.append(self.word_box)
 
         # Hint (translation)
@@ -558,6 +734,13 @@ class App(Adw.Application):
         self.stack.add_named(scroll, "soundout")
 
     def _on_mode_select(self, _btn, mode):
+        if mode not in self._pages_built:
+            {
+                "explore": self._build_explore_page,
+                "find": self._build_find_page,
+                "soundout": self._build_soundout_page,
+            }[mode]()
+            self._pages_built.add(mode)
         self.current_mode = mode
         self.stack.set_visible_child_name(mode)
         if mode == "find":
@@ -568,17 +751,16 @@ class App(Adw.Application):
     def _on_explore_letter(self, btn):
         letter = btn.letter
         # Show phonetic info
-        name = LETTER_PHONETICS.get(letter, letter)
-        sound = LETTER_SOUNDS.get(letter, letter)
+        i = LETTER_INDEX[letter]
+        name = PHONETICS[i]
+        sound = SOUNDS_T[i]
         self.explore_feedback.set_text(
             _("{letter} — Name: '{name}', Sound: '{sound}'").format(
                 letter=letter, name=name, sound=sound
             )
         )
         # Speak
-        GLib.timeout_add(50, lambda: _speak(
-            f"{letter}. {name}. {sound}.", self.tts_engine
-        ))
+        self.tts.speak(f"{letter}. {name}. {sound}.")
         # Record progress
         self.progress.record_correct(letter)
         self._update_stats()
@@ -589,39 +771,26 @@ class App(Adw.Application):
         self.find_next_btn.set_visible(False)
 
         # Pick target and distractors
-        letters = list(LETTER_PHONETICS.keys())
-        self.target_letter = random.choice(letters)
-        choices = [self.target_letter]
-        distractors = [l for l in letters if l != self.target_letter]
-        choices.extend(random.sample(distractors, min(5, len(distractors))))
-        random.shuffle(choices)
-
-        # Clear grid
-        while True:
-            child = self.find_grid.get_first_child()
-            if child is None:
-                break
-            self.find_grid.remove(child)
+        idxs = random.sample(range(len(LETTERS)), len(self._find_buttons))
+        i = idxs[0]
+        self.target_letter = LETTERS[i]
+        choices = [LETTERS[j] for j in idxs]
+        random.shuffle(choices)  # re-shuffle so target isn't always first
 
-        # Add letter buttons
-        for i, letter in enumerate(choices):
-            btn = LetterButton(letter, i)
-            btn.connect("clicked", self._on_find_letter)
-            self.find_grid.append(btn)
+        # Relabel letter buttons
+        for btn, letter in zip(self._find_buttons, choices):
+            btn.set_letter(letter)
 
         # Speak the target letter sound
-        GLib.timeout_add(500, lambda: _speak(
-            LETTER_PHONETICS[self.target_letter], self.tts_engine
-        ))
+        self.tts.speak_bytes(PHONETIC_BYTES[i])
         self.find_instruction.set_text(
-            _("🎯 Which letter says '{sound}'?").format(
-                sound=LETTER_PHONETICS[self.target_letter]
-            )
+            _("🎯 Which letter says '{sound}'?").format(sound=PHONETICS[i])
         )
 
     def _on_replay_find(self, _btn):
         if self.target_letter:
-            _speak(LETTER_PHONETICS[self.target_letter], self.tts_engine)
+            self.tts.interrupt()
+            self.tts.speak_bytes(PHONETIC_BYTES[LETTER_INDEX[self.target_letter]])
 
     def _on_find_letter(self, btn):
         if btn.letter == self.target_letter:
@@ -631,16 +800,23 @@ class App(Adw.Application):
             btn.add_css_class("correct")
             self.find_next_btn.set_visible(True)
             # Cheer sound
-            GLib.timeout_add(200, lambda: _speak(
-                random.choice([_("Correct!"), _("Yes!"), _("Great!")]),
-                self.tts_engine,
-            ))
+            self.tts.speak(random.choice([_("Correct!"), _("Yes!"), _("Great!")]))
         else:
             self.find_feedback.set_text(random.choice(TRY_AGAIN))
             self.progress.record_wrong()
             self._update_stats()
             btn.add_css_class("wrong")
-            GLib.timeout_add(1000, lambda: btn.remove_css_class("wrong"))
+            # One shared timer clears all wrong marks 1 s after the last miss
+            if self._wrong_source:
+                GLib.source_remove(self._wrong_source)
+            self._wrong_source = GLib.timeout_add(1000, self._clear_wrong)
+
+    def _clear_wrong(self):
+        """Remove the wrong-answer highlight from the find buttons."""
+        self._wrong_source = 0
+        for btn in self._find_buttons:
+            btn.remove_css_class("wrong")
+        return False
 
     def _start_soundout_round(self):
         """Start a new sound-out-the-word round."""
@@ -657,35 +833,36 @@ class App(Adw.Application):
         self.current_word_idx = 0
         self.word_hint.set_text(f"({hint})")
 
+        for i, lbl in enumerate(self._word_labels):
+            if i < len(self.current_word):
+                lbl.set_text(self.current_word[i])
+                lbl.set_visible(True)
+            else:
+                lbl.set_visible(False)
         self._update_word_display()
 
         # Speak the whole word first
-        GLib.timeout_add(300, lambda: _speak(self.current_word, self.tts_engine))
+        self.tts.speak(self.current_word)
 
     def _update_word_display(self):
         """Update the word display with highlighted current letter."""
-        # Clear
-        while True:
-            child = self.word_box.get_first_child()
-            if child is None:
-                break
-            self.word_box.remove(child)
-
-        for i, ch in enumerate(self.current_word):
-            lbl = Gtk.Label(label=ch)
-            lbl.add_css_class("word-letter")
+        for i in range(len(self.current_word)):
+            lbl = self._word_labels[i]
             if i < self.current_word_idx:
                 lbl.add_css_class("word-letter-done")
-            elif i == self.current_word_idx:
+            else:
+                lbl.remove_css_class("word-letter-done")
+            if i == self.current_word_idx:
                 lbl.add_css_class("word-letter-active")
-            self.word_box.append(lbl)
+            else:
+                lbl.remove_css_class("word-letter-active")
 
     def _on_sound_current(self, _btn):
         """Sound out the current letter."""
         if self.current_word and self.current_word_idx < len(self.current_word):
             letter = self.current_word[self.current_word_idx]
-            sound = LETTER_SOUNDS.get(letter, letter)
-            _speak(sound, self.tts_engine)
+            sound, sound_bytes = _letter_sound(letter)
+            self.tts.speak_bytes(sound_bytes)
             self.soundout_feedback.set_text(
                 _("'{letter}' sounds like '{sound}'").format(letter=letter, sound=sound)
             )
@@ -719,22 +896,26 @@ class App(Adw.Application):
                             level=self.progress.data["level"]
                         )
                     )
-                GLib.timeout_add(200, lambda: _speak(
-                    _("Amazing! You did it!"), self.tts_engine
-                ))
+                self.tts.speak(_("Amazing! You did it!"))
             else:
                 # Sound next letter
                 letter = self.current_word[self.current_word_idx]
-                sound = LETTER_SOUNDS.get(letter, letter)
-                GLib.timeout_add(100, lambda: _speak(sound, self.tts_engine))
+                sound, sound_bytes = _letter_sound(letter)
+                self.tts.speak_bytes(sound_bytes)
                 self.soundout_feedback.set_text(
                     _("'{letter}' sounds like '{sound}'").format(letter=letter, sound=sound)
                 )
 
     def _update_stats(self):
         """Update stars and streak display."""
-        self.stars_label.set_text(f"⭐ {self.progress.data['stars']}")
-        self.streak_label.set_text(f"🔥 {self.progress.data['streak']}")
+        stars = self.progress.data["stars"]
+        if stars != self._last_stars:
+            self.stars_label.set_text(f"⭐ {stars}")
+            self._last_stars = stars
+        streak = self.progress.data["streak"]
+        if streak != self._last_streak:
+            self.streak_label.set_text(f"🔥 {streak}")
+            self._last_streak = streak
 
     def _on_about(self, *_args):
         about = Adw.AboutDialog(
@@ -769,20 +950,15 @@ class App(Adw.Application):
 
     def _on_icon_clicked(self, *args):
         """Handle clicks on app icon for easter egg."""
+        now = time.monotonic()
+        if now - self._egg_last > 0.5:
+            self._egg_clicks = 0
         self._egg_clicks += 1
-        if self._egg_timer:
-            GLib.source_remove(self._egg_timer)
-        self._egg_timer = GLib.timeout_add(500, self._reset_egg)
+        self._egg_last = now
         if self._egg_clicks >= 7:
             self._trigger_easter_egg()
             self._egg_clicks = 0
 
-    def _reset_egg(self):
-        """Reset easter egg click counter."""
-        self._egg_clicks = 0
-        self._egg_timer = None
-        return False
-
     def _trigger_easter_egg(self):
         """Show the secret easter egg!"""
         try: